@@ -63,6 +63,14 @@ impl PdfExtractor {
         parse_single_reference(ref_text, prev_authors, &self.config)
     }
 
+    /// Clean and validate an extracted title (part of step 4).
+    ///
+    /// Returns an empty string when the title is rejected (venue-only,
+    /// author list, non-reference content, or too long).
+    pub fn clean_title(&self, title: &str, from_quotes: bool) -> String {
+        title::clean_title_with_config(title, from_quotes, &self.config)
+    }
+
     /// Run the full extraction pipeline on a PDF file.
     #[cfg(feature = "pdf")]
     pub fn extract_references(&self, pdf_path: &Path) -> Result<ExtractionResult, PdfError> {
@@ -690,4 +698,49 @@ mod tests {
             ParsedRef::Skip(..) => panic!("Expected a reference"),
         }
     }
+
+    // ── clean_title ──
+
+    #[test]
+    fn test_clean_title_truncates_venue_after_question_mark() {
+        let ext = PdfExtractor::new();
+        let cleaned = ext.clean_title(
+            "Can transformers sort? International Conference on AI",
+            false,
+        );
+        assert_eq!(cleaned, "Can transformers sort?");
+    }
+
+    #[test]
+    fn test_clean_title_rejects_venue_only() {
+        let ext = PdfExtractor::new();
+        assert_eq!(
+            ext.clean_title("SIAM Journal on Scientific Computing", false),
+            ""
+        );
+    }
+
+    #[test]
+    fn test_clean_title_shared_across_threads() {
+        // The Python binding cleans batches with the GIL released, sharing
+        // one extractor by reference.
+        fn assert_sync<T: Sync>() {}
+        assert_sync::<PdfExtractor>();
+
+        let ext = PdfExtractor::new();
+        let titles = [
+            "Attention Is All You Need",
+            "Journal of Machine Learning Research",
+        ];
+        let cleaned: Vec<String> = std::thread::scope(|s| {
+            titles
+                .iter()
+                .map(|title| s.spawn(|| ext.clean_title(title, false)))
+                .collect::<Vec<_>>()
+                .into_iter()
+                .map(|handle| handle.join().unwrap())
+                .collect()
+        });
+        assert_eq!(cleaned, ["Attention Is All You Need", ""]);
+    }
 }
@@ -1,5 +1,5 @@
 use once_cell::sync::Lazy;
-use regex::Regex;
+use regex::{Regex, RegexSet};
 use std::collections::HashSet;
 
 use crate::config::PdfParsingConfig;
@@ -267,13 +267,14 @@ pub(crate) fn clean_title_with_config(
     }
 
     // FIX 4 (NeurIPS): Reject non-reference content (checklists, acknowledgments)
-    static NON_REFERENCE_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| {
-        vec![
-            Regex::new(r"(?i)^[•\-]\s+(?:The answer|Released models|If you are using)").unwrap(),
-            Regex::new(r"(?i)^We gratefully acknowledge").unwrap(),
-        ]
+    static NON_REFERENCE_PATTERNS: Lazy<RegexSet> = Lazy::new(|| {
+        RegexSet::new([
+            r"(?i)^[•\-]\s+(?:The answer|Released models|If you are using)",
+            r"(?i)^We gratefully acknowledge",
+        ])
+        .unwrap()
     });
-    if NON_REFERENCE_PATTERNS.iter().any(|re| re.is_match(&title)) {
+    if NON_REFERENCE_PATTERNS.is_match(&title) {
         return String::new();
     }
 
@@ -502,15 +503,16 @@ fn is_venue_only(text: &str) -> bool {
         return false;
     }
 
-    static VENUE_ONLY_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| {
-        vec![
-            Regex::new(r"(?i)^(?:SIAM|IEEE|ACM|PNAS)\s+(?:Journal|Transactions|Review)").unwrap(),
-            Regex::new(r"(?i)^(?:Journal|Transactions|Proceedings)\s+(?:of|on)\s+").unwrap(),
-            Regex::new(r"(?i)^Advances\s+in\s+Neural").unwrap(),
-        ]
+    static VENUE_ONLY_PATTERNS: Lazy<RegexSet> = Lazy::new(|| {
+        RegexSet::new([
+            r"(?i)^(?:SIAM|IEEE|ACM|PNAS)\s+(?:Journal|Transactions|Review)",
+            r"(?i)^(?:Journal|Transactions|Proceedings)\s+(?:of|on)\s+",
+            r"(?i)^Advances\s+in\s+Neural",
+        ])
+        .unwrap()
     });
 
-    VENUE_ONLY_PATTERNS.iter().any(|re| re.is_match(text))
+    VENUE_ONLY_PATTERNS.is_match(text)
 }
 
 /// Check if extracted text is an IEEE ALL CAPS author list, not a paper title.
@@ -279,6 +279,36 @@ impl PyPdfExtractor {
         }
     }
 
+    /// Clean and validate an extracted title.
+    ///
+    /// Returns an empty string when the title is rejected (venue-only,
+    /// author list, non-reference content, or too long).
+    #[pyo3(signature = (title, from_quotes=false))]
+    fn clean_title(&mut self, title: &str, from_quotes: bool) -> PyResult<String> {
+        let ext = self.extractor()?;
+        Ok(ext.clean_title(title, from_quotes))
+    }
+
+    /// Clean and validate a batch of extracted titles in one call.
+    ///
+    /// Releases the GIL while the titles are processed. Rejected titles
+    /// come back as empty strings, in input order.
+    #[pyo3(signature = (titles, from_quotes=false))]
+    fn clean_titles(
+        &mut self,
+        py: Python<'_>,
+        titles: Vec<String>,
+        from_quotes: bool,
+    ) -> PyResult<Vec<String>> {
+        let ext = self.extractor()?;
+        Ok(py.allow_threads(|| {
+            titles
+                .iter()
+                .map(|title| ext.clean_title(title, from_quotes))
+                .collect()
+        }))
+    }
+
     /// Run extraction on already-extracted text (steps 2–4).
     ///
     /// Useful when you've already extracted text and want to re-parse
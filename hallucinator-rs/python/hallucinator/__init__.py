@@ -161,6 +161,18 @@ class PdfExtractor:
         """
         return self._native.parse_reference(text, prev_authors=prev_authors)
 
+    def clean_title(self, title, from_quotes=False):
+        """Clean and validate an extracted title.
+
+        Returns an empty string when the title is rejected (venue-only,
+        author list, non-reference content, or too long).
+        """
+        return self._native.clean_title(title, from_quotes=from_quotes)
+
+    def clean_titles(self, titles, from_quotes=False):
+        """Clean and validate a batch of titles in a single native call."""
+        return self._native.clean_titles(titles, from_quotes=from_quotes)
+
     def extract_from_text(self, text):
         """Run the full extraction pipeline on already-extracted text.
 
@@ -65,6 +65,10 @@ class PdfExtractor:
     def parse_reference(
         self, text: str, prev_authors: Optional[list[str]] = None
     ) -> Optional[Reference]: ...
+    def clean_title(self, title: str, from_quotes: bool = False) -> str: ...
+    def clean_titles(
+        self, titles: list[str], from_quotes: bool = False
+    ) -> list[str]: ...
     def extract_from_text(self, text: str) -> ExtractionResult: ...
     def extract(self, path: str) -> ExtractionResult: ...
     def extract_text(self, path: str) -> str: ...
@@ -85,6 +85,10 @@ class NativePdfExtractor:
     def parse_reference_detailed(
         self, text: str, prev_authors: Optional[list[str]] = None
     ) -> tuple[Optional[Reference], Optional[str]]: ...
+    def clean_title(self, title: str, from_quotes: bool = False) -> str: ...
+    def clean_titles(
+        self, titles: list[str], from_quotes: bool = False
+    ) -> list[str]: ...
     def extract_from_text(self, text: str) -> ExtractionResult: ...
 
 # ── Validation pipeline ──
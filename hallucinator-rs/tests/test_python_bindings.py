@@ -134,6 +134,33 @@ def test_parse_reference_no_prev_authors():
     assert ref.doi is None or ref.doi == ""
 
 
+# ── clean_title ──
+
+
+def test_clean_title_truncates_venue_after_question_mark():
+    ext = PdfExtractor()
+    cleaned = ext.clean_title("Can transformers sort? International Conference on AI")
+    assert cleaned == "Can transformers sort?"
+
+
+def test_clean_title_rejects_venue_only():
+    ext = PdfExtractor()
+    assert ext.clean_title("SIAM Journal on Scientific Computing") == ""
+
+
+def test_clean_titles_batch():
+    ext = PdfExtractor()
+    titles = [
+        "Attention Is All You Need",
+        "AL, Andrew Ahn, Nic Becker, Stephanie Carroll,",
+        "Journal of Machine Learning Research",
+    ]
+    cleaned = ext.clean_titles(titles)
+    assert cleaned == [ext.clean_title(t) for t in titles]
+    assert cleaned[0] == "Attention Is All You Need"
+    assert cleaned[1:] == ["", ""]
+
+
 # ── Config: min_title_words ──
 
 